@@ -2,7 +2,7 @@
 Flask CLI Command Extensions
 """
 from service import app
-from service.models import db
+from service.models import db, Product
 
 
 ######################################################################
@@ -18,3 +18,17 @@ def db_create():
     db.drop_all()
     db.create_all()
     db.session.commit()
+
+
+######################################################################
+# Command to add missing indexes without touching any data
+# Usage: flask db-index
+######################################################################
+@app.cli.command("db-index")
+def db_index():
+    """
+    Creates any Product indexes that do not exist yet. Safe to run
+    against a database that already holds data.
+    """
+    for index in Product.__table__.indexes:
+        index.create(db.engine, checkfirst=True)
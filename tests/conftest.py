@@ -0,0 +1,47 @@
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Shared pytest fixtures for the test suite
+"""
+import os
+import logging
+import pytest
+
+# Tests default to an in-memory database; set DATABASE_URI (or use
+# 'make tests-postgres') to run them against PostgreSQL instead.
+# This must happen before importing service, which initializes the database
+# from service.config at import time.
+# Flask-SQLAlchemy gives sqlite :memory: a StaticPool with check_same_thread=False
+# so every session shares the one connection and sees the same tables.
+os.environ.setdefault("DATABASE_URI", "sqlite:///:memory:")
+DATABASE_URI = os.environ["DATABASE_URI"]
+
+# pylint: disable=wrong-import-position
+from service.models import Product, db  # noqa: E402
+from service import app  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def _db():
+    """Configures the app for testing, reusing the database set up at import"""
+    app.config["TESTING"] = True
+    app.config["DEBUG"] = False
+    app.logger.setLevel(logging.CRITICAL)
+    # importing service already ran init_db() against DATABASE_URI
+    if app.config["SQLALCHEMY_DATABASE_URI"] != DATABASE_URI:
+        app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URI
+        Product.init_db(app)
+    yield
+    db.session.close()
@@ -5,7 +5,9 @@ import os
 from unittest import TestCase
 from unittest.mock import patch, MagicMock
 from click.testing import CliRunner
-from service.common.cli_commands import db_create
+from sqlalchemy import Index
+from service.models import Product
+from service.common.cli_commands import db_create, db_index
 
 
 class TestFlaskCLI(TestCase):
@@ -21,3 +23,18 @@ class TestFlaskCLI(TestCase):
         with patch.dict(os.environ, {"FLASK_APP": "service:app"}, clear=True):
             result = self.runner.invoke(db_create)
             self.assertEqual(result.exit_code, 0)
+
+    @patch.object(Index, "create", autospec=True)
+    @patch('service.common.cli_commands.db')
+    def test_db_index(self, db_mock, create_mock):
+        """It should create each Product index only if it is missing"""
+        db_mock.return_value = MagicMock()
+        with patch.dict(os.environ, {"FLASK_APP": "service:app"}, clear=True):
+            result = self.runner.invoke(db_index)
+            self.assertEqual(result.exit_code, 0)
+        self.assertEqual(create_mock.call_count, 2)
+        created = {call.args[0] for call in create_mock.call_args_list}
+        self.assertEqual(created, set(Product.__table__.indexes))
+        for call in create_mock.call_args_list:
+            self.assertEqual(call.args[1], db_mock.engine)
+            self.assertEqual(call.kwargs, {"checkfirst": True})
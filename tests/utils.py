@@ -0,0 +1,34 @@
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test helpers shared across test modules
+"""
+import contextlib
+from sqlalchemy import event
+
+
+@contextlib.contextmanager
+def count_queries(connection):
+    """Collects every SQL statement sent on connection inside the block"""
+    queries = []
+
+    def _before_cursor_execute(conn, cursor, statement, *args, **kwargs):  # pylint: disable=unused-argument
+        queries.append(statement)
+
+    event.listen(connection, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(connection, "before_cursor_execute", _before_cursor_execute)